@@ -10,28 +10,65 @@ test results, and generates CSV and Markdown reports.
 import requests
 import json
 import csv
+import multiprocessing
 import pandas as pd
 from datetime import datetime
 from bs4 import BeautifulSoup
 from typing import Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import argparse
+import os
+import queue
+import re
 import sys
+import threading
+
+from hpc_history import HPCHistory
 
 
 class CDashHPCParser:
     """Parser for CDash HDF5 HPC test results"""
 
-    def __init__(self, base_url: str = "https://my.cdash.org", days_back: int = 7):
+    def __init__(self, base_url: str = "https://my.cdash.org", days_back: int = 7,
+                 max_workers: int = 8, cache_dir: str = ".cdash_cache",
+                 parse_workers: int = None, queue_size: int = 32,
+                 raw_dir: str = None, replay: bool = False):
         self.base_url = base_url
         self.project_url = f"{base_url}/index.php?project=HDF5"
         self.hpc_url = f"{base_url}/index.php?project=HDF5#!#HPC"
         self.api_url = f"{base_url}/api/v1/index.php"
+        self.view_test_url = f"{base_url}/api/v1/viewTest.php"
+        self.test_details_url = f"{base_url}/api/v1/testDetails.php"
         self.days_back = days_back
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
+        self.parse_workers = (os.cpu_count() or 1) if parse_workers is None else parse_workers
+        self.queue_size = queue_size
+        self.raw_dir = raw_dir
+        self.replay = replay
+        self.test_details = {}
+        self.history = None
+        self.probe_df = None
+        self.session = self._new_session()
+        self._local = threading.local()
+
+    def _new_session(self) -> requests.Session:
+        """Create an HTTP session with the parser's default headers"""
+        session = requests.Session()
+        session.headers.update({
             'User-Agent': 'CDash-HPC-Parser/1.0',
             'Accept': 'application/json, text/html, */*'
         })
+        return session
+
+    def _thread_session(self) -> requests.Session:
+        """Return a session owned by the calling worker thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._new_session()
+            self._local.session = session
+        return session
 
     def fetch_page_content(self, url: str) -> str:
         """Fetch page content with error handling"""
@@ -64,6 +101,7 @@ class CDashHPCParser:
                         'date': date or datetime.now().strftime('%Y-%m-%d'),
                         'site': cells[0].get_text(strip=True) if cells[0] else '',
                         'build_name': build_name,
+                        'build_id': self._extract_build_id(row),
                         'build_stamp': cells[2].get_text(strip=True) if cells[2] else '',
                         'update_files': self._extract_number(cells[3].get_text(strip=True)) if len(cells) > 3 else 0,
                         'configure_warnings': self._extract_number(cells[4].get_text(strip=True)) if len(cells) > 4 else 0,
@@ -100,10 +138,17 @@ class CDashHPCParser:
 
     def _extract_number(self, text: str) -> int:
         """Extract number from text, return 0 if not found"""
-        import re
         numbers = re.findall(r'\d+', text)
         return int(numbers[0]) if numbers else 0
 
+    def _extract_build_id(self, row) -> str:
+        """Extract the CDash build id from links in a build table row"""
+        for link in row.find_all('a', href=True):
+            match = re.search(r'buildid=(\d+)', link['href'])
+            if match:
+                return match.group(1)
+        return ''
+
     def _parse_build_name(self, build_name: str) -> Dict[str, str]:
         """Parse build name into arch, os, mpi, compiler, version components"""
         # Initialize default values
@@ -212,81 +257,227 @@ class CDashHPCParser:
 
         return dates
 
-    def fetch_hpc_results(self) -> List[Dict[str, Any]]:
-        """Fetch and parse HPC test results from CDash across multiple dates"""
-        print(f"Fetching HDF5 CDash HPC results from last {self.days_back} days...")
-
-        all_builds = []
-        dates = self._generate_date_list()
-
-        for date in dates:
-            print(f"  Processing date: {date}")
-
-            # Try multiple approaches to get HPC-specific data for this date
-            builds = []
+    def _replay_date_list(self) -> List[str]:
+        """List the dates saved in the raw directory, newest first"""
+        try:
+            names = os.listdir(self.raw_dir)
+        except OSError as e:
+            print(f"Error reading raw directory {self.raw_dir}: {e}")
+            return []
 
-            # 1. Try HPC-specific API endpoint with date
-            builds = self._fetch_hpc_api_data(date)
+        dates = set()
+        for name in names:
+            match = re.match(r'(\d{4}-\d{2}-\d{2})-\d+\.raw$', name)
+            if match:
+                dates.add(match.group(1))
 
-            # 2. If API fails, try parsing the HPC page directly with date
-            if not builds:
-                builds = self._fetch_hpc_page_data(date)
+        return sorted(dates, reverse=True)
 
-            # 3. Fallback to general project data with HPC filtering
-            if not builds:
-                date_url = f"{self.project_url}&date={date}"
-                content = self.fetch_page_content(date_url)
-                if content:
-                    builds = self.parse_build_data(content, date)
+    def fetch_hpc_results(self) -> List[Dict[str, Any]]:
+        """Fetch and parse HPC test results from CDash across multiple dates
+
+        Fetching and parsing run as a pipeline: I/O worker threads stream raw
+        responses into a bounded queue, a process pool parses them into build
+        records and a single collector merges the results in date order. A
+        date whose current source yields no builds is sent back to the I/O
+        workers for its next fallback source.
+        """
+        if self.replay:
+            dates = self._replay_date_list()
+            print(f"Replaying HDF5 CDash HPC results for {len(dates)} dates from {self.raw_dir}...")
+        else:
+            dates = self._generate_date_list()
+            print(f"Fetching HDF5 CDash HPC results from last {self.days_back} days...")
 
-            # 4. Try general API with HPC filtering and date
-            if not builds:
-                builds = self._try_api_fetch(date)
+        results = self._run_fetch_pipeline(dates)
 
+        all_builds = []
+        for date in dates:
+            builds = results.get(date, [])
             if builds:
-                print(f"    Found {len(builds)} builds for {date}")
+                print(f"  {date}: found {len(builds)} builds")
                 all_builds.extend(builds)
             else:
-                print(f"    No builds found for {date}")
+                print(f"  {date}: no builds found")
 
         print(f"Total found: {len(all_builds)} builds from frontier, perlmutter, dane, corona, and tuolumne")
         return all_builds
 
-    def _fetch_hpc_api_data(self, date: str = None) -> List[Dict[str, Any]]:
-        """Fetch HPC-specific data via CDash API for a specific date"""
-        # Try HPC-specific API endpoints
+    def _fetch_sources(self, date: str = None) -> List[tuple]:
+        """Return the (kind, url) sources to try in order for a specific date"""
         date_param = f"&date={date}" if date else ""
-        hpc_endpoints = [
-            f"{self.api_url}?project=HDF5{date_param}&filterdata={{\"filters\":{{\"buildgroup\":\"HPC\"}}}}",
-            f"{self.api_url}?project=HDF5{date_param}&buildgroup=HPC",
-            f"{self.api_url}?project=HDF5{date_param}&filter=HPC"
+        hpc_url_with_date = f"{self.hpc_url}&date={date}" if date else self.hpc_url
+
+        return [
+            # 1. HPC-specific API endpoints with date
+            ('json', f"{self.api_url}?project=HDF5{date_param}&filterdata={{\"filters\":{{\"buildgroup\":\"HPC\"}}}}"),
+            ('json', f"{self.api_url}?project=HDF5{date_param}&buildgroup=HPC"),
+            ('json', f"{self.api_url}?project=HDF5{date_param}&filter=HPC"),
+            # 2. HPC page with date (the #!#HPC fragment might be handled by JavaScript)
+            ('hpc_html', hpc_url_with_date),
+            # 3. General project page with HPC filtering
+            ('html', f"{self.project_url}{date_param}"),
+            # 4. General API with HPC filtering
+            ('json', f"{self.api_url}?project=HDF5{date_param}")
         ]
 
-        for endpoint in hpc_endpoints:
-            try:
-                response = self.session.get(endpoint, timeout=30)
-                if response.status_code == 200:
-                    data = response.json()
-                    builds = self._parse_api_data(data, date)
-                    if builds:
-                        return builds
-            except (requests.RequestException, json.JSONDecodeError):
-                continue
-
-        return []
-
-    def _fetch_hpc_page_data(self, date: str = None) -> List[Dict[str, Any]]:
-        """Fetch data from HPC-specific page for a specific date"""
-        print(f"Trying HPC-specific page for {date}...")
-
-        # The fragment identifier #!#HPC might be handled by JavaScript
-        # Try to fetch the main page and look for HPC-specific data
-        hpc_url_with_date = f"{self.hpc_url}&date={date}" if date else self.hpc_url
-        content = self.fetch_page_content(hpc_url_with_date)
-        if not content:
+    def _run_fetch_pipeline(self, dates: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Run the fetch/parse pipeline, returning builds keyed by date"""
+        if not dates:
+            return {}
+
+        io_workers = max(1, min(self.max_workers, len(dates)))
+        fetch_queue = queue.Queue()
+        raw_queue = queue.Queue(maxsize=self.queue_size)
+        parsed_queue = queue.Queue()
+        in_flight = threading.Semaphore(self.queue_size)
+
+        if self.parse_workers > 0:
+            # Forking after the I/O threads start could copy held locks into
+            # the workers, so start them from a clean forkserver process
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            pool = ProcessPoolExecutor(max_workers=self.parse_workers,
+                                       mp_context=multiprocessing.get_context(method),
+                                       initializer=_init_parse_worker)
+        else:
+            pool = None
+        owned_pool = pool
+
+        # Every date handed to a worker must reach the collector, even on
+        # errors, or the collector would wait for it forever
+        def io_worker():
+            while True:
+                item = fetch_queue.get()
+                if item is None:
+                    return
+                date, step = item
+                try:
+                    kind, url = self._fetch_sources(date)[step]
+                    content = self._fetch_raw(date, step, url)
+                except Exception as e:
+                    print(f"Error fetching results for {date}: {e}")
+                    content = ""
+                if content:
+                    raw_queue.put((date, step, kind, content))
+                else:
+                    parsed_queue.put((date, step, []))
+
+        def dispatcher():
+            nonlocal pool
+            while True:
+                item = raw_queue.get()
+                if item is None:
+                    return
+                date, step, kind, content = item
+                if pool is None:
+                    parsed_queue.put((date, step, self._parse_raw_safe(kind, content, date)))
+                    continue
+
+                # Bound the parse jobs in flight so a slow pool backs up the I/O workers
+                in_flight.acquire()
+                try:
+                    future = pool.submit(_parse_raw_page, kind, content, date)
+                except BrokenProcessPool:
+                    print("Parse pool is broken, parsing in-process")
+                    in_flight.release()
+                    pool = None
+                    parsed_queue.put((date, step, self._parse_raw_safe(kind, content, date)))
+                    continue
+                except Exception as e:
+                    print(f"Error parsing results for {date}: {e}")
+                    in_flight.release()
+                    parsed_queue.put((date, step, []))
+                    continue
+                future.add_done_callback(
+                    lambda f, date=date, step=step, kind=kind, content=content: self._collect_parsed(
+                        f, date, step, kind, content, parsed_queue, in_flight))
+
+        threads = [threading.Thread(target=io_worker, daemon=True) for _ in range(io_workers)]
+        threads.append(threading.Thread(target=dispatcher, daemon=True))
+        for thread in threads:
+            thread.start()
+
+        for date in dates:
+            fetch_queue.put((date, 0))
+
+        # Single collector: advance dates through their fallback sources
+        results = {}
+        try:
+            while len(results) < len(dates):
+                date, step, builds = parsed_queue.get()
+                if builds or step + 1 >= len(self._fetch_sources(date)):
+                    results[date] = builds
+                else:
+                    fetch_queue.put((date, step + 1))
+
+            for _ in range(io_workers):
+                fetch_queue.put(None)
+            raw_queue.put(None)
+            for thread in threads:
+                thread.join()
+        finally:
+            if owned_pool is not None:
+                owned_pool.shutdown(cancel_futures=True)
+
+        return results
+
+    def _collect_parsed(self, future, date: str, step: int, kind: str, content: str,
+                        parsed_queue, in_flight):
+        """Hand a finished parse job to the collector"""
+        in_flight.release()
+        try:
+            builds = future.result()
+        except BrokenProcessPool:
+            builds = self._parse_raw_safe(kind, content, date)
+        except Exception as e:
+            print(f"Error parsing results for {date}: {e}")
+            builds = []
+        parsed_queue.put((date, step, builds))
+
+    def _parse_raw_safe(self, kind: str, content: str, date: str) -> List[Dict[str, Any]]:
+        """Parse a raw response in-process, returning no builds on error"""
+        try:
+            return self.parse_raw_page(kind, content, date)
+        except Exception as e:
+            print(f"Error parsing results for {date}: {e}")
             return []
 
-        # Parse for HPC-specific sections
+    def _fetch_raw(self, date: str, step: int, url: str) -> str:
+        """Fetch a raw response, reading from or saving to the raw directory"""
+        raw_path = os.path.join(self.raw_dir, f"{date}-{step}.raw") if self.raw_dir else None
+
+        if self.replay:
+            try:
+                with open(raw_path, encoding='utf-8') as f:
+                    return f.read()
+            except (OSError, TypeError):
+                return ""
+
+        try:
+            response = self._thread_session().get(url, timeout=30)
+        except requests.RequestException as e:
+            print(f"Error fetching {url}: {e}")
+            return ""
+        if response.status_code != 200:
+            return ""
+
+        if raw_path:
+            os.makedirs(self.raw_dir, exist_ok=True)
+            with open(raw_path, 'w', encoding='utf-8') as f:
+                f.write(response.text)
+
+        return response.text
+
+    def parse_raw_page(self, kind: str, content: str, date: str = None) -> List[Dict[str, Any]]:
+        """Parse a raw API or page response of the given kind into build records"""
+        if kind == 'json':
+            return self._parse_api_data(json.loads(content), date)
+        if kind == 'hpc_html':
+            return self._parse_hpc_page(content, date)
+        return self.parse_build_data(content, date)
+
+    def _parse_hpc_page(self, content: str, date: str = None) -> List[Dict[str, Any]]:
+        """Parse builds from HPC-specific sections of a CDash page"""
         soup = BeautifulSoup(content, 'html.parser')
 
         # Look for HPC-specific elements or data attributes
@@ -305,21 +496,6 @@ class CDashHPCParser:
 
         return builds
 
-    def _try_api_fetch(self, date: str = None) -> List[Dict[str, Any]]:
-        """Try to fetch data via general CDash API for a specific date"""
-        date_param = f"&date={date}" if date else ""
-        api_url = f"{self.api_url}?project=HDF5{date_param}"
-
-        try:
-            response = self.session.get(api_url, timeout=30)
-            if response.status_code == 200:
-                data = response.json()
-                return self._parse_api_data(data, date)
-        except (requests.RequestException, json.JSONDecodeError):
-            pass
-
-        return []
-
     def _parse_api_data(self, data: Dict, date: str = None) -> List[Dict[str, Any]]:
         """Parse data from CDash API response for a specific date"""
         builds = []
@@ -335,6 +511,7 @@ class CDashHPCParser:
                             'date': date or datetime.now().strftime('%Y-%m-%d'),
                             'site': build.get('site', ''),
                             'build_name': build_name,
+                            'build_id': str(build.get('id', '')),
                             'build_stamp': build.get('buildstamp', ''),
                             'update_files': build.get('update', {}).get('files', 0),
                             'configure_warnings': build.get('configure', {}).get('warnings', 0),
@@ -354,6 +531,162 @@ class CDashHPCParser:
 
         return builds
 
+    def fetch_failing_test_details(self, builds: List[Dict[str, Any]],
+                                   max_outputs: int = 20) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch failed and not-run test details for builds with test problems
+
+        Test lists and per-test output excerpts are fetched concurrently on a
+        bounded thread pool. Results are cached per build id together with the
+        build's failed/not-run counts; a cache entry is only used while those
+        counts still match, and builds with failed excerpt fetches are not
+        cached, so partial results are fetched again on the next run.
+        """
+        targets = {}
+        for build in builds:
+            build.setdefault('failed_tests', '')
+            build.setdefault('not_run_tests', '')
+            build_id = str(build.get('build_id', '') or '')
+            if build_id and (build.get('test_failed', 0) or build.get('test_not_run', 0)):
+                targets.setdefault(build_id, []).append(build)
+
+        if not targets:
+            print("No builds with failed or not-run tests to drill into")
+            return {}
+
+        details = {}
+        for build_id, build_list in targets.items():
+            cached = self._load_cached_tests(build_id, build_list[0])
+            if cached is not None:
+                details[build_id] = cached
+
+        pending = [build_id for build_id in targets if build_id not in details]
+        print(f"Fetching test details for {len(targets)} builds "
+              f"({len(targets) - len(pending)} cached, {self.max_workers} workers)...")
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                # 1. Fetch the list of failed/not-run tests for each build
+                test_lists = dict(zip(pending, pool.map(self._fetch_build_tests, pending)))
+
+                # 2. Fetch output excerpts for failed tests across all builds
+                jobs = []
+                for build_id, tests in test_lists.items():
+                    if tests is None:
+                        continue
+                    failed = [t for t in tests if t['status'] == 'Failed' and t['buildtestid']]
+                    jobs.extend((build_id, t) for t in failed[:max_outputs])
+                outputs = pool.map(lambda job: self._fetch_test_output(job[1]['buildtestid']), jobs)
+                incomplete = set()
+                for (build_id, test), output in zip(jobs, outputs):
+                    if output is None:
+                        incomplete.add(build_id)
+                        output = ''
+                    test['output'] = output
+
+            for build_id, tests in test_lists.items():
+                if tests is None:
+                    print(f"    Could not fetch tests for build {build_id}")
+                    continue
+                details[build_id] = tests
+                if build_id not in incomplete:
+                    self._save_cached_tests(build_id, tests, targets[build_id][0])
+
+        for build_id, build_list in targets.items():
+            tests = details.get(build_id, [])
+            for build in build_list:
+                build['failed_tests'] = ';'.join(t['name'] for t in tests if t['status'] == 'Failed')
+                build['not_run_tests'] = ';'.join(t['name'] for t in tests if t['status'] == 'Not Run')
+
+        self.test_details = details
+        return details
+
+    def _fetch_build_tests(self, build_id: str):
+        """Fetch failed and not-run tests for one build, None on error"""
+        tests = []
+        for flag, status in (('onlyfailed', 'Failed'), ('onlynotrun', 'Not Run')):
+            url = f"{self.view_test_url}?buildid={build_id}&{flag}"
+            try:
+                response = self._thread_session().get(url, timeout=30)
+                response.raise_for_status()
+                data = response.json()
+            except (requests.RequestException, json.JSONDecodeError) as e:
+                print(f"Error fetching {url}: {e}")
+                return None
+
+            for test in data.get('tests', []):
+                tests.append({
+                    'name': test.get('name', ''),
+                    # The onlyfailed/onlynotrun query already fixes the status;
+                    # CDash's own label can vary and is kept only in details
+                    'status': status,
+                    'time': test.get('time', test.get('execTime', '')),
+                    'details': test.get('details', ''),
+                    'buildtestid': str(test.get('buildtestid', test.get('id', '')) or ''),
+                    'output': ''
+                })
+
+        return tests
+
+    def _fetch_test_output(self, buildtestid: str, max_lines: int = 20,
+                           max_chars: int = 2000):
+        """Fetch the tail of a test's output as a short excerpt, None on error"""
+        url = f"{self.test_details_url}?buildtestid={buildtestid}"
+        try:
+            response = self._thread_session().get(url, timeout=30)
+            response.raise_for_status()
+            output = response.json().get('test', {}).get('output', '') or ''
+        except (requests.RequestException, json.JSONDecodeError) as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+        excerpt = '\n'.join(output.strip().splitlines()[-max_lines:])
+        return excerpt[-max_chars:]
+
+    def _test_cache_path(self, build_id: str) -> str:
+        """Return the cache file path for a build's test details"""
+        return os.path.join(self.cache_dir, 'tests', f"{build_id}.json")
+
+    def _load_cached_tests(self, build_id: str, build: Dict[str, Any]):
+        """Load cached test details for a build, None if not cached or stale"""
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._test_cache_path(build_id), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Counts change while a build is still submitting tests
+        if (not isinstance(entry, dict)
+                or entry.get('test_failed') != int(build.get('test_failed', 0) or 0)
+                or entry.get('test_not_run') != int(build.get('test_not_run', 0) or 0)):
+            return None
+        return entry.get('tests')
+
+    def _save_cached_tests(self, build_id: str, tests: List[Dict[str, Any]],
+                           build: Dict[str, Any]):
+        """Write a build's test details and test counts to the cache"""
+        if not self.cache_dir:
+            return
+        entry = {
+            'test_failed': int(build.get('test_failed', 0) or 0),
+            'test_not_run': int(build.get('test_not_run', 0) or 0),
+            'tests': tests
+        }
+        path = self._test_cache_path(build_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def save_test_details(self, filename: str = "hpc_test_details.json"):
+        """Save failed/not-run test details to a JSON file"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.test_details, f, indent=2, sort_keys=True)
+
+        print(f"Test details saved to {filename}")
+
     def _create_sample_data(self) -> List[Dict[str, Any]]:
         """Create sample data for HPC systems when real data isn't available"""
         print("Using sample data for HPC systems - real data not accessible")
@@ -395,6 +728,7 @@ class CDashHPCParser:
                 'date': dates[i % len(dates)],  # Cycle through dates
                 'site': sample['site'],
                 'build_name': sample['build_name'],
+                'build_id': '',
                 'build_stamp': '20240924-0000-Nightly',
                 'build_group': 'HPC',
                 'update_files': 0,
@@ -431,10 +765,25 @@ class CDashHPCParser:
         print(f"Results saved to {filename}")
 
     def generate_markdown_report(self, csv_filename: str = "hpc_test_results.csv",
-                                md_filename: str = "hpc_test_report.md"):
+                                md_filename: str = "hpc_test_report.md",
+                                details_filename: str = None,
+                                probe_filename: str = None):
         """Generate markdown report from CSV data"""
+        self.probe_df = None
+        if probe_filename:
+            try:
+                self.probe_df = pd.read_csv(probe_filename)
+            except (FileNotFoundError, pd.errors.EmptyDataError):
+                pass
+        if details_filename and not self.test_details:
+            try:
+                with open(details_filename, encoding='utf-8') as f:
+                    self.test_details = json.load(f)
+            except (OSError, ValueError):
+                pass
+
         try:
-            df = pd.read_csv(csv_filename)
+            df = pd.read_csv(csv_filename, dtype={'build_id': str})
         except FileNotFoundError:
             print(f"CSV file {csv_filename} not found, generating no-data report")
             report = self._create_no_data_report()
@@ -557,6 +906,14 @@ Generated on: {timestamp}
         for i, build in enumerate(compiler_stats[:5], 1):
             report += f"{i}. **{build['compiler']}** ({build['version']}, {build['mpi']}): {build['pass_rate']:.2f}% ({build['total_tests']} tests)\n"
 
+        report += self._create_failing_tests_section(df_sorted)
+
+        if self.history is not None:
+            report += self.history.create_markdown_sections()
+
+        if self.probe_df is not None:
+            report += self._create_probe_section(df)
+
         report += f"""
 ---
 *Report generated by CDash HPC Parser on {timestamp}*
@@ -564,6 +921,91 @@ Generated on: {timestamp}
 
         return report
 
+    def _create_failing_tests_section(self, df: pd.DataFrame) -> str:
+        """Create markdown listing failed and not-run tests per build"""
+        if 'failed_tests' not in df.columns:
+            return ""
+
+        section = """
+## Failing Tests
+
+| Site | Build | Date | Test | Status | Time |
+|------|-------|------|------|--------|------|
+"""
+        excerpts = ""
+        found = False
+
+        for _, row in df.iterrows():
+            build_id = row.get('build_id') if pd.notna(row.get('build_id')) else ''
+            tests = self.test_details.get(build_id)
+            if tests is None:
+                # Fall back to the names stored in the CSV
+                tests = [{'name': name, 'status': status, 'time': '', 'output': ''}
+                         for column, status in (('failed_tests', 'Failed'), ('not_run_tests', 'Not Run'))
+                         if pd.notna(row.get(column)) and row.get(column)
+                         for name in str(row[column]).split(';')]
+
+            for test in tests:
+                found = True
+                section += f"| {row['site']} | {row['build_name']} | {row['date']} | {test['name']} | {test['status']} | {test['time']} |\n"
+                if test.get('output'):
+                    excerpts += f"""
+<details>
+<summary>{row['site']} {row['build_name']}: {test['name']}</summary>
+
+```
+{test['output']}
+```
+
+</details>
+"""
+
+        if not found:
+            return ""
+
+        return section + excerpts
+
+    def _create_probe_section(self, df: pd.DataFrame) -> str:
+        """Create markdown comparing MPI launch latency with test failures per site and date"""
+        probe_df = self.probe_df[self.probe_df['date'].isin(df['date'])]
+        if probe_df.empty:
+            return ""
+
+        failures = df.groupby(['site', 'date'])['test_failed'].sum()
+        build_sites = df['site'].dropna().unique()
+
+        section = """
+## MPI Launch Latency
+
+| Site | Date | Runs | Failed Launches | Max Ranks | Median Startup | Max Startup | Max Finalize | Failed Tests |
+|------|------|------|-----------------|-----------|----------------|-------------|--------------|--------------|
+"""
+        for (site, date), group in probe_df.groupby(['site', 'date']):
+            # Failed, timed-out and incomplete launches record no usable timings
+            ok = group[group['status'] == 'ok']
+            failed_launches = len(group) - len(ok)
+            # Probe sites match CDash sites loosely, like _is_hpc_build;
+            # '-' means no CDash build to compare against
+            matched = [build_site for build_site in build_sites
+                       if self._sites_match(site, build_site) and (build_site, date) in failures]
+            failed_tests = sum(failures[(build_site, date)] for build_site in matched) if matched else "-"
+            if ok.empty:
+                latency = "- | - | - | -"
+            else:
+                latency = (f"{ok['ranks'].max()} | {ok['startup_max'].median():.3f}s | "
+                           f"{ok['startup_max'].max():.3f}s | {ok['finalize_max'].max():.3f}s")
+            section += f"| {site} | {date} | {len(group)} | {failed_launches} | {latency} | {failed_tests} |\n"
+
+        return section
+
+    def _sites_match(self, probe_site: str, build_site: str) -> bool:
+        """Check if a probe site and a CDash site name the same system"""
+        probe_site = str(probe_site).strip().lower()
+        build_site = str(build_site).strip().lower()
+        if not probe_site or not build_site:
+            return False
+        return probe_site in build_site or build_site in probe_site
+
     def _create_no_data_report(self) -> str:
         """Create markdown report when no test data is available"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
@@ -594,6 +1036,20 @@ Generated on: {timestamp}
 """
 
 
+_parse_worker = None
+
+
+def _init_parse_worker():
+    """Create the parser used by a parse pool process"""
+    global _parse_worker
+    _parse_worker = CDashHPCParser()
+
+
+def _parse_raw_page(kind: str, content: str, date: str) -> List[Dict[str, Any]]:
+    """Parse a raw response in a parse pool process"""
+    return _parse_worker.parse_raw_page(kind, content, date)
+
+
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(description='Parse HDF5 CDash HPC test results from multiple dates')
@@ -605,24 +1061,62 @@ def main():
                       help='Number of days back to fetch data (default: 7)')
     parser.add_argument('--skip-fetch', action='store_true',
                       help='Skip fetching data, only generate report from existing CSV')
+    parser.add_argument('--details', default='hpc_test_details.json',
+                      help='Output JSON filename for failing test details (default: hpc_test_details.json)')
+    parser.add_argument('--skip-test-details', action='store_true',
+                      help='Skip fetching per-test details for builds with failed or not-run tests')
+    parser.add_argument('--workers', type=int, default=8,
+                      help='Number of concurrent workers for fetching from CDash (default: 8)')
+    parser.add_argument('--cache-dir', default='.cdash_cache',
+                      help='Directory for cached per-build test details (default: .cdash_cache)')
+    parser.add_argument('--parse-workers', type=int, default=None,
+                      help='Number of processes for HTML/JSON parsing, 0 to parse in-process (default: CPU count)')
+    parser.add_argument('--raw-dir', default=None,
+                      help='Directory to save raw CDash responses to, or read them from with --replay')
+    parser.add_argument('--replay', action='store_true',
+                      help='Parse all dates saved in --raw-dir instead of fetching from CDash (ignores --days)')
+    parser.add_argument('--mpi-probe', default='mpi_probe_results.csv',
+                      help='MPI launch probe results from mpi_probe.py (default: mpi_probe_results.csv)')
+    parser.add_argument('--history', default='hpc_history_state.json',
+                      help='Per-configuration history state file (default: hpc_history_state.json)')
+    parser.add_argument('--skip-history', action='store_true',
+                      help='Skip regression and flakiness tracking')
 
     args = parser.parse_args()
 
-    cdash_parser = CDashHPCParser(days_back=args.days)
+    if args.replay and not args.raw_dir:
+        parser.error('--replay requires --raw-dir')
+
+    cdash_parser = CDashHPCParser(days_back=args.days, max_workers=args.workers,
+                                  cache_dir=args.cache_dir, parse_workers=args.parse_workers,
+                                  raw_dir=args.raw_dir, replay=args.replay)
 
     if not args.skip_fetch:
         # Fetch and parse results
         builds = cdash_parser.fetch_hpc_results()
 
         if builds:
+            # Drill down into builds with failed or not-run tests
+            if not args.skip_test_details and not args.replay:
+                cdash_parser.fetch_failing_test_details(builds)
+                cdash_parser.save_test_details(args.details)
+
             # Save to CSV
             cdash_parser.save_to_csv(builds, args.csv)
         else:
             print("No HPC builds found.")
             print("Will generate a markdown report indicating no data available.")
 
+    if not args.skip_history:
+        # Fold new builds into the running regression/flakiness state
+        cdash_parser.history = HPCHistory(args.history)
+        cdash_parser.history.load()
+        if not args.skip_fetch and builds:
+            cdash_parser.history.update(builds)
+            cdash_parser.history.save()
+
     # Generate markdown report
-    cdash_parser.generate_markdown_report(args.csv, args.markdown)
+    cdash_parser.generate_markdown_report(args.csv, args.markdown, args.details, args.mpi_probe)
 
     print(f"\nCompleted successfully!")
     print(f"CSV report: {args.csv}")
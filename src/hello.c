@@ -1,10 +1,22 @@
 #include <mpi.h>
 #include <stdio.h>
+#include <time.h>
+
+// Wall-clock time in seconds, comparable with the launcher's clock
+double wall_time() {
+  struct timespec ts;
+  clock_gettime(CLOCK_REALTIME, &ts);
+  return ts.tv_sec + ts.tv_nsec * 1e-9;
+}
 
 int main(int argc, char** argv) {
+  double init_start = wall_time();
+
   // Initialize the MPI environment
   MPI_Init(NULL, NULL);
 
+  double init_end = wall_time();
+
   // Get the number of processes
   int world_size;
   MPI_Comm_size(MPI_COMM_WORLD, &world_size);
@@ -23,5 +35,11 @@ int main(int argc, char** argv) {
          processor_name, world_rank, world_size);
 
   // Finalize the MPI environment.
+  double finalize_start = wall_time();
   MPI_Finalize();
+  double finalize_end = wall_time();
+
+  // Timing line read by mpi_probe.py
+  printf("probe %d %d %s %.6f %.6f %.6f %.6f\n", world_rank, world_size,
+         processor_name, init_start, init_end, finalize_start, finalize_end);
 }
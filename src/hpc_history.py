@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+HPC Test History Tracker
+
+This module keeps running per-configuration state for HDF5 HPC builds so
+that new regressions, fixes and flaky configurations can be reported without
+rescanning the full nightly history. The state is updated incrementally from
+each day's new build records.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Any
+
+
+class HPCHistory:
+    """Incremental regression and flakiness state for HPC build configurations"""
+
+    def __init__(self, state_file: str = "hpc_history_state.json", window: int = 14,
+                 min_flips: int = 3):
+        self.state_file = state_file
+        self.window = window
+        self.min_flips = min_flips
+        self.configs = {}
+        self.last_update = {'date': '', 'new_failures': [], 'fixed': []}
+
+    def load(self):
+        """Load state from the state file, starting empty if it does not exist"""
+        try:
+            with open(self.state_file, encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            print(f"History state {self.state_file} not found, starting new history")
+            return
+        except (OSError, ValueError) as e:
+            print(f"Error reading history state {self.state_file}: {e}")
+            return
+
+        self.configs = state.get('configs', {})
+        self.last_update = state.get('last_update', self.last_update)
+
+    def save(self):
+        """Write state to the state file"""
+        state = {
+            'window': self.window,
+            'configs': self.configs,
+            'last_update': self.last_update
+        }
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.state_file)
+
+        print(f"History state saved to {self.state_file}")
+
+    def update(self, builds: List[Dict[str, Any]]):
+        """Fold new build records into the state
+
+        Only records newer than the last one seen for their configuration are
+        applied, so overlapping fetch windows do not count a build twice.
+        """
+        new_failures = []
+        fixed = []
+        latest_date = ''
+
+        for build in sorted(builds, key=lambda b: (str(b.get('date', '')), str(b.get('build_stamp', '')))):
+            outcome = self._build_outcome(build)
+            if outcome is None:
+                continue
+
+            key = self._config_key(build)
+            date = str(build.get('date', ''))
+            build_key = f"{build.get('build_stamp', '')}|{build.get('build_id', '')}"
+            config = self.configs.setdefault(key, {
+                'site': build.get('site', ''),
+                'build_name': build.get('build_name', ''),
+                'status': '',
+                'last_good': '',
+                'first_bad': '',
+                'last_date': '',
+                'seen': [],
+                'window': [],
+                'tests': {}
+            })
+
+            if date < config['last_date'] or (date == config['last_date'] and build_key in config['seen']):
+                continue
+            if date > config['last_date']:
+                config['last_date'] = date
+                config['seen'] = []
+            config['seen'].append(build_key)
+            latest_date = max(latest_date, date)
+
+            previous = config['status']
+            config['status'] = outcome
+            config['window'] = (config['window'] + [1 if outcome == 'pass' else 0])[-self.window:]
+            new_tests, fixed_tests = self._update_tests(config, build, outcome, date)
+
+            # Report configuration flips and also tests that start failing or
+            # get fixed while the configuration as a whole keeps failing
+            if outcome == 'pass':
+                config['last_good'] = date
+                config['first_bad'] = ''
+            elif previous != 'fail':
+                config['first_bad'] = date
+
+            if outcome == 'fail' and (previous != 'fail' or new_tests):
+                new_failures.append({'config': key, 'date': date,
+                                     'last_good': config['last_good'], 'tests': new_tests})
+            if (outcome == 'pass' and previous == 'fail') or fixed_tests:
+                fixed.append({'config': key, 'date': date, 'tests': fixed_tests})
+
+        # A run that applies nothing new (e.g. only refetched builds) has no
+        # changes to report, so do not carry over the previous night's events
+        self.last_update = {
+            'date': latest_date or datetime.now().strftime('%Y-%m-%d'),
+            'new_failures': new_failures,
+            'fixed': fixed
+        }
+
+        print(f"History updated: {len(new_failures)} new failures, {len(fixed)} fixed")
+
+    def _update_tests(self, config: Dict[str, Any], build: Dict[str, Any],
+                      outcome: str, date: str) -> tuple:
+        """Update per-test windows for a configuration
+
+        Returns the tests that started failing and the tests that went from
+        failing to passing with this build.
+        """
+        failed = [name for name in str(build.get('failed_tests', '') or '').split(';') if name]
+        if outcome == 'fail' and not failed:
+            # Test names were not fetched for this build
+            return [], []
+
+        tests = config['tests']
+        new_tests = []
+        fixed_tests = []
+        for name in set(tests) | set(failed):
+            test = tests.setdefault(name, {'status': '', 'last_good': '', 'first_bad': '', 'window': []})
+            test_outcome = 'fail' if name in failed else 'pass'
+            if test_outcome == 'fail' and test['status'] != 'fail':
+                test['first_bad'] = date
+                new_tests.append(name)
+            elif test_outcome == 'pass':
+                if test['status'] == 'fail':
+                    fixed_tests.append(name)
+                test['last_good'] = date
+                test['first_bad'] = ''
+            test['status'] = test_outcome
+            test['window'] = (test['window'] + [1 if test_outcome == 'pass' else 0])[-self.window:]
+
+            # Stop tracking tests that have passed for the whole window
+            if all(test['window']) and len(test['window']) >= self.window:
+                del tests[name]
+
+        return sorted(new_tests), sorted(fixed_tests)
+
+    def _build_outcome(self, build: Dict[str, Any]):
+        """Return 'pass' or 'fail' for a build, None if it has no results"""
+        if build.get('configure_errors', 0) or build.get('build_errors', 0) or build.get('test_failed', 0):
+            return 'fail'
+        if build.get('test_passed', 0):
+            return 'pass'
+        return None
+
+    def _config_key(self, build: Dict[str, Any]) -> str:
+        """Return the key identifying a build configuration"""
+        return f"{build.get('site', '')} {build.get('build_name', '')}"
+
+    def _flips(self, window: List[int]) -> int:
+        """Count pass/fail transitions in an outcome window"""
+        return sum(1 for a, b in zip(window, window[1:]) if a != b)
+
+    def flaky(self) -> List[Dict[str, Any]]:
+        """Return configurations and tests that flip between pass and fail"""
+        flaky = []
+        for key, config in self.configs.items():
+            flips = self._flips(config['window'])
+            if flips >= self.min_flips:
+                flaky.append({'config': key, 'test': '', 'flips': flips,
+                              'pass_rate': sum(config['window']) / len(config['window']) * 100})
+            for name, test in config['tests'].items():
+                flips = self._flips(test['window'])
+                if flips >= self.min_flips:
+                    flaky.append({'config': key, 'test': name, 'flips': flips,
+                                  'pass_rate': sum(test['window']) / len(test['window']) * 100})
+
+        flaky.sort(key=lambda x: (-x['flips'], x['config'], x['test']))
+        return flaky
+
+    def create_markdown_sections(self) -> str:
+        """Create markdown sections for new failures, fixes and flaky tests"""
+        new_failures = self.last_update.get('new_failures', [])
+        fixed = self.last_update.get('fixed', [])
+        flaky = self.flaky()
+
+        report = f"""
+## History
+
+Changes from the update of {self.last_update.get('date') or 'unknown date'}.
+
+### New Failures
+"""
+        if new_failures:
+            report += """
+| Configuration | First Bad | Last Good | New Failing Tests |
+|---------------|-----------|-----------|-------------------|
+"""
+            for item in new_failures:
+                tests = ', '.join(item.get('tests', [])) or '-'
+                report += f"| {item['config']} | {item['date']} | {item['last_good'] or 'never'} | {tests} |\n"
+        else:
+            report += "\nNo new failures.\n"
+
+        report += """
+### Fixed
+"""
+        if fixed:
+            report += """
+| Configuration | Fixed On | Fixed Tests |
+|---------------|----------|-------------|
+"""
+            for item in fixed:
+                tests = ', '.join(item.get('tests', [])) or '-'
+                report += f"| {item['config']} | {item['date']} | {tests} |\n"
+        else:
+            report += "\nNo newly fixed configurations or tests.\n"
+
+        report += f"""
+### Flaky
+
+Configurations or tests with at least {self.min_flips} pass/fail flips in the last {self.window} runs.
+"""
+        if flaky:
+            report += """
+| Configuration | Test | Flips | Pass Rate |
+|---------------|------|-------|-----------|
+"""
+            for item in flaky:
+                report += f"| {item['config']} | {item['test'] or '-'} | {item['flips']} | {item['pass_rate']:.1f}% |\n"
+        else:
+            report += "\nNo flaky configurations or tests.\n"
+
+        return report
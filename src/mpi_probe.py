@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+MPI Launch Latency Probe
+
+This script runs the hello program (hello.c) across a sweep of rank and
+ranks-per-node counts and records MPI startup and finalize latency and
+per-rank host placement. Results are appended to a CSV keyed by site and
+date, like the CDash build records, so slow launches can be correlated with
+HDF5 parallel test failures and timeouts.
+
+The default launcher template uses the MPICH/Cray-style -ppn option. With
+Open MPI pass e.g. --launcher "mpiexec -n {ranks} --map-by ppr:{ppn}:node {exe}",
+and with Slurm --launcher "srun -n {ranks} --ntasks-per-node {ppn} {exe}".
+
+The daily report workflow cannot reach the HPC hosts, so probe results are
+synced by hand: run the probe from this repository's src directory so the
+CSV lands in src/mpi_probe_results.csv, then commit and push that file.
+cdash_hpc.py adds it to the next report.
+"""
+
+import csv
+import os
+import shlex
+import socket
+import subprocess
+import time
+from datetime import datetime
+from typing import Dict, List, Any
+import argparse
+
+
+# CDash sites tracked by cdash_hpc.py (see CDashHPCParser._is_hpc_build)
+HPC_SITES = ['frontier', 'perlmutter', 'dane', 'corona', 'tuolumne']
+
+
+class MPIProbe:
+    """Runner for MPI launch latency and scaling probes"""
+
+    def __init__(self, exe: str = "./a.out",
+                 launcher: str = "mpiexec -n {ranks} -ppn {ppn} {exe}",
+                 site: str = None, timeout: int = 300):
+        self.exe = exe
+        self.launcher = launcher
+        self.site = site or self._default_site()
+        self.timeout = timeout
+
+    def run_sweep(self, ranks_list: List[int], ppn_list: List[int],
+                  repeat: int = 1, max_nodes: int = None) -> List[Dict[str, Any]]:
+        """Run the probe for every ranks/ranks-per-node combination
+
+        Combinations needing more than max_nodes nodes are skipped so the
+        recorded placement matches what the job actually allocated.
+        """
+        print(f"Probing MPI launch on {self.site} with: {self.launcher}")
+
+        results = []
+        for ranks in dict.fromkeys(ranks_list):
+            for ppn in dict.fromkeys(ppn_list):
+                if ppn > ranks:
+                    continue
+                if max_nodes and -(-ranks // ppn) > max_nodes:
+                    print(f"  ranks={ranks} ppn={ppn}: skipped, needs more than {max_nodes} nodes")
+                    continue
+                for run in range(repeat):
+                    result = self.run_once(ranks, ppn, run)
+                    print(f"  ranks={ranks} ppn={ppn} run={run}: {result['status']}, "
+                          f"startup {result['startup_max']:.3f}s, "
+                          f"finalize {result['finalize_max']:.3f}s, "
+                          f"{result['hosts_used']} hosts")
+                    results.append(result)
+
+        return results
+
+    def run_once(self, ranks: int, ppn: int, run: int = 0) -> Dict[str, Any]:
+        """Launch the hello program once and collect its timings"""
+        nodes = -(-ranks // ppn)
+        command = self.launcher.format(ranks=ranks, ppn=ppn, nodes=nodes, exe=self.exe)
+
+        result = {
+            'timestamp': datetime.now().isoformat(),
+            'date': datetime.now().strftime('%Y-%m-%d'),
+            'site': self.site,
+            'ranks': ranks,
+            'ppn': ppn,
+            'nodes': nodes,
+            'run': run,
+            'status': 'ok',
+            'returncode': 0,
+            'ranks_reported': 0,
+            'launch_wall': 0.0,
+            'startup_min': 0.0,
+            'startup_max': 0.0,
+            'init_max': 0.0,
+            'finalize_max': 0.0,
+            'teardown': 0.0,
+            'hosts_used': 0,
+            'placement': '',
+            'launcher': command,
+            'fabric_env': self._fabric_env(),
+            'stderr_tail': ''
+        }
+
+        launch_start = time.time()
+        try:
+            proc = subprocess.run(shlex.split(command), capture_output=True, text=True,
+                                  timeout=self.timeout)
+            output = proc.stdout
+            stderr = proc.stderr
+            result['returncode'] = proc.returncode
+            if proc.returncode != 0:
+                result['status'] = 'failed'
+        except subprocess.TimeoutExpired as e:
+            output = e.stdout.decode(errors='replace') if isinstance(e.stdout, bytes) else (e.stdout or '')
+            stderr = e.stderr.decode(errors='replace') if isinstance(e.stderr, bytes) else (e.stderr or '')
+            result['status'] = 'timeout'
+            result['returncode'] = -1
+        except OSError as e:
+            output = ''
+            stderr = str(e)
+            result['status'] = 'failed'
+            result['returncode'] = -1
+        launch_end = time.time()
+
+        # Keep the end of stderr on one line so the reason for a failed launch
+        # is visible in the CSV
+        result['stderr_tail'] = ' | '.join(stderr.strip().splitlines()[-5:])[-500:]
+        if result['status'] != 'ok':
+            print(f"Launch {result['status']} ({result['returncode']}): {command}")
+            if result['stderr_tail']:
+                print(f"    stderr: {result['stderr_tail']}")
+
+        result['launch_wall'] = launch_end - launch_start
+        result.update(self._summarize_ranks(self._parse_probe_output(output), launch_start, launch_end))
+
+        if result['status'] == 'ok' and result['ranks_reported'] != ranks:
+            result['status'] = 'incomplete'
+
+        return result
+
+    def _parse_probe_output(self, output: str) -> List[Dict[str, Any]]:
+        """Parse the per-rank timing lines printed by the hello program"""
+        ranks = []
+        for line in output.splitlines():
+            fields = line.split()
+            if len(fields) != 8 or fields[0] != 'probe':
+                continue
+            try:
+                ranks.append({
+                    'rank': int(fields[1]),
+                    'size': int(fields[2]),
+                    'host': fields[3],
+                    'init_start': float(fields[4]),
+                    'init_end': float(fields[5]),
+                    'finalize_start': float(fields[6]),
+                    'finalize_end': float(fields[7])
+                })
+            except ValueError:
+                continue
+
+        return sorted(ranks, key=lambda r: r['rank'])
+
+    def _summarize_ranks(self, ranks: List[Dict[str, Any]], launch_start: float,
+                         launch_end: float) -> Dict[str, Any]:
+        """Reduce per-rank timings to startup, finalize and placement metrics"""
+        if not ranks:
+            return {}
+
+        # Startup is measured from the launcher start on this host, so it
+        # includes clock skew between nodes in multi-node runs
+        startup = [r['init_end'] - launch_start for r in ranks]
+        return {
+            'ranks_reported': len(ranks),
+            'startup_min': min(startup),
+            'startup_max': max(startup),
+            'init_max': max(r['init_end'] - r['init_start'] for r in ranks),
+            'finalize_max': max(r['finalize_end'] - r['finalize_start'] for r in ranks),
+            'teardown': launch_end - max(r['finalize_end'] for r in ranks),
+            'hosts_used': len({r['host'] for r in ranks}),
+            'placement': ';'.join(f"{r['rank']}:{r['host']}" for r in ranks)
+        }
+
+    def _default_site(self) -> str:
+        """Return the CDash site name for this system, falling back to the hostname"""
+        # Compute node hostnames often do not name the system (e.g. nid001234
+        # on perlmutter), so check the center's environment first
+        candidates = [os.environ.get('NERSC_HOST', ''), os.environ.get('LMOD_SYSTEM_NAME', ''),
+                      socket.getfqdn()]
+        for candidate in candidates:
+            for site in HPC_SITES:
+                if site in candidate.lower():
+                    return site
+
+        hostname = socket.gethostname()
+        print(f"Warning: {hostname} is not a CDash-tracked site; pass --site to correlate "
+              f"with CDash builds")
+        return hostname
+
+    def _fabric_env(self) -> str:
+        """Return the libfabric/MPI environment settings that affect startup"""
+        prefixes = ('FI_', 'MPICH_', 'OMPI_MCA_', 'PMI_')
+        return ';'.join(f"{k}={v}" for k, v in sorted(os.environ.items())
+                        if k.startswith(prefixes))
+
+    def save_to_csv(self, results: List[Dict[str, Any]], filename: str = "mpi_probe_results.csv"):
+        """Append results to CSV file"""
+        if not results:
+            print("No probe results to save to CSV")
+            return
+
+        exists = os.path.exists(filename) and os.path.getsize(filename) > 0
+        with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=results[0].keys())
+            if not exists:
+                writer.writeheader()
+            for result in results:
+                writer.writerow(result)
+
+        print(f"Results appended to {filename}")
+
+
+def _int_list(text: str) -> List[int]:
+    """Parse a comma-separated list of positive integers"""
+    try:
+        values = [int(x) for x in text.split(',') if x.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers: {text}")
+    if not values or any(v <= 0 for v in values):
+        raise argparse.ArgumentTypeError(f"values must be positive integers: {text}")
+    return values
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Probe MPI launch latency and rank placement with the hello program')
+    parser.add_argument('--exe', default='./a.out',
+                      help='Compiled hello program (default: ./a.out)')
+    parser.add_argument('--launcher', default='mpiexec -n {ranks} -ppn {ppn} {exe}',
+                      help='Launch command template with {ranks}, {ppn}, {nodes} and {exe}; the default '
+                           'uses MPICH/Cray-style -ppn (default: "mpiexec -n {ranks} -ppn {ppn} {exe}")')
+    parser.add_argument('--ranks', type=_int_list, default=[1, 2, 4, 8, 24],
+                      help='Comma-separated total rank counts (default: 1,2,4,8,24)')
+    parser.add_argument('--ppn', type=_int_list, default=[1, 24],
+                      help='Comma-separated ranks-per-node counts (default: 1,24)')
+    parser.add_argument('--repeat', type=int, default=3,
+                      help='Number of runs per configuration (default: 3)')
+    parser.add_argument('--timeout', type=int, default=300,
+                      help='Seconds before a launch is killed (default: 300, matching DART_TESTING_TIMEOUT)')
+    parser.add_argument('--max-nodes', type=int, default=None,
+                      help='Skip combinations needing more nodes than this, e.g. the job allocation')
+    parser.add_argument('--site', default=None,
+                      help='CDash site name, e.g. frontier (default: detected from the environment, '
+                           'else the hostname)')
+    parser.add_argument('--csv', default='mpi_probe_results.csv',
+                      help='Output CSV filename, appended to (default: mpi_probe_results.csv)')
+
+    args = parser.parse_args()
+
+    probe = MPIProbe(exe=args.exe, launcher=args.launcher, site=args.site, timeout=args.timeout)
+    results = probe.run_sweep(args.ranks, args.ppn, args.repeat, args.max_nodes)
+    probe.save_to_csv(results, args.csv)
+
+
+if __name__ == "__main__":
+    main()